@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from traffic_controller import HeadlessGUI, JunctionConfig, TrafficSignal
+
+def headless_signal(config):
+    return TrafficSignal(HeadlessGUI(), config, sleep=lambda seconds: None)
+
+def test_grouped_phases_use_phase_matrix():
+    signal = headless_signal(JunctionConfig.with_approaches(4, phases=[[0, 2], [1, 3]]))
+    assert not signal.one_lane_phases
+    signal.update_counts([3, 10, 1, 2])
+    assert list(signal.phase_demand()) == [4, 12]
+    assert signal.select_phase() == 1
+
+def test_grouped_phases_are_cleared_together():
+    signal = headless_signal(JunctionConfig.with_approaches(4, phases=[[0, 2], [1, 3]]))
+    signal.update_counts([3, 10, 1, 2])
+    signal.run_cycle()
+    assert list(signal.state.vehicle_counts) == [0, 0, 0, 0]
+    assert list(signal.state.waiting_times) == [1, 1, 1, 1]
+
+def test_one_lane_phases_match_lane_counts():
+    signal = headless_signal(JunctionConfig.with_approaches(3))
+    assert signal.one_lane_phases
+    signal.lanes['lane2'].update(6)
+    assert np.array_equal(signal.phase_demand(), [0, 6, 0])
+    assert signal.select_phase() == 1
+
+def test_empty_phase_is_rejected():
+    with pytest.raises(ValueError):
+        JunctionConfig.with_approaches(4, phases=[[0, 1], []])
+
+def test_unknown_lane_in_phase_is_rejected():
+    with pytest.raises(ValueError):
+        JunctionConfig.with_approaches(4, phases=[[0, 1], [2, 4]])
+    with pytest.raises(ValueError):
+        JunctionConfig.with_approaches(4, phases=[[-1]])
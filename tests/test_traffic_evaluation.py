@@ -0,0 +1,113 @@
+import numpy as np
+
+from traffic_controller import HeadlessGUI, JunctionConfig, TrafficSignal
+from traffic_evaluation import demand_from_log, simulate
+from traffic_log import EventLogWriter
+from traffic_policies import ALL_RED, FixedTimePolicy, SignalPolicy, WebsterPolicy
+from traffic_workload import TrafficWorkload, WorkloadBatch
+
+def quiet_demand(arrivals):
+    arrivals = np.asarray(arrivals, dtype=np.int64)
+    steps = len(arrivals)
+    return WorkloadBatch(np.arange(steps, dtype=np.float64), arrivals,
+                         np.full(steps, -1, dtype=np.int64), np.zeros(steps, dtype=bool))
+
+# Plays back a fixed list of decisions and records when each was asked for
+class ScriptedPolicy(SignalPolicy):
+    name = "scripted"
+
+    def __init__(self, actions, default=(ALL_RED, 5, False)):
+        self.actions = list(actions)
+        self.default = default
+        self.times = []
+
+    def decide(self, time, queues, arrived):
+        self.times.append(time)
+        return self.actions.pop(0) if self.actions else self.default
+
+def test_closed_form_matches_per_second_loop():
+    steps, lanes, green, lost_time, saturation = 5000, 4, 20, 3, 0.5
+    workload = TrafficWorkload(lanes, seed=5, arrival_rate=0.1, emergency_probability=0, pedestrian_probability=0)
+    demand = workload.next_batch(steps)
+    result = simulate(FixedTimePolicy(green), JunctionConfig.with_approaches(lanes), demand, saturation, lost_time)
+
+    queues = np.zeros(lanes)
+    delay = max_queue = 0.0
+    step, phase = 0, 0
+    while step < steps:
+        # Every phase change after the first green starts with lost_time of all red
+        lanes_served = [None] * (lost_time if step else 0) + [phase] * green
+        for served in lanes_served:
+            if step >= steps:
+                break
+            queues += demand.arrivals[step]
+            if served is not None:
+                queues[served] = max(queues[served] - saturation, 0)
+            delay += queues.sum()
+            max_queue = max(max_queue, queues.max())
+            step += 1
+        phase = (phase + 1) % lanes
+
+    assert np.isclose(result.total_delay, delay)
+    assert np.isclose(result.max_queue, max_queue)
+    assert np.isclose(result.arrived - result.departed, queues.sum())
+
+def test_gap_out_ends_green_when_phase_is_empty():
+    arrivals = np.zeros((100, 2), dtype=np.int64)
+    arrivals[0] = [4, 0]
+    policy = ScriptedPolicy([(0, 60, True)])
+    result = simulate(policy, JunctionConfig.with_approaches(2), quiet_demand(arrivals), 0.5, 0)
+    # 4 vehicles at 0.5/s clear after 8 seconds, so the next decision comes at t=8
+    assert policy.times[:2] == [0, 8]
+    assert result.departed == 4
+
+def test_without_gap_out_green_runs_full_duration():
+    arrivals = np.zeros((100, 2), dtype=np.int64)
+    arrivals[0] = [4, 0]
+    policy = ScriptedPolicy([(0, 60, False)])
+    simulate(policy, JunctionConfig.with_approaches(2), quiet_demand(arrivals), 0.5, 0)
+    assert policy.times[:2] == [0, 60]
+
+def test_pedestrian_in_emergency_window_is_still_served():
+    steps = 200
+    demand = quiet_demand(np.zeros((steps, 4)))
+    demand.emergency_lanes[5] = 2
+    demand.pedestrians[5] = True
+    policy = ScriptedPolicy([])
+    simulate(policy, JunctionConfig.with_approaches(4), demand, 0.5, 0)
+    # Decisions at 0; emergency 10 s from 5; pedestrian all red 60 s from 15
+    assert policy.times[:3] == [0, 75, 80]
+
+def test_webster_splits_green_by_critical_flow_ratio():
+    policy = WebsterPolicy(min_cycle=30, max_cycle=150, min_green=5)
+    policy.reset(JunctionConfig.with_approaches(2), saturation_flow=0.5, lost_time=3)
+    policy.cycle_plan(0, np.zeros(2))
+    plan = policy.cycle_plan(100, np.array([20.0, 10.0]))
+    # y = [0.4, 0.2], L = 6: C0 = (1.5 * 6 + 5) / (1 - 0.6) = 35, green = 29 split 2:1
+    assert [(phase, green) for phase, green, gap_out in plan] == [(0, 19), (1, 10)]
+
+def test_demand_from_log_recovers_observed_arrivals(tmp_path):
+    now = [1000.0]
+    workload = TrafficWorkload(4, seed=11, arrival_rate=2, emergency_probability=0, pedestrian_probability=0)
+    arrivals = workload.next_batch(30).arrivals
+
+    def sleep(seconds):
+        now[0] += seconds
+
+    with EventLogWriter(tmp_path, clock=lambda: now[0]) as writer:
+        signal = TrafficSignal(HeadlessGUI(), sleep=sleep, event_log=writer)
+        for cycle_arrivals in arrivals:
+            signal.update_counts(signal.state.vehicle_counts + cycle_arrivals)
+            signal.run_cycle()
+            sleep(1)
+
+    demand = demand_from_log(tmp_path)
+    assert np.array_equal(demand.arrivals.sum(axis=0), arrivals.sum(axis=0))
+    assert np.count_nonzero(demand.arrivals.sum(axis=1)) == np.count_nonzero(arrivals.sum(axis=1))
+
+def test_demand_from_log_includes_lane_updates(tmp_path):
+    with EventLogWriter(tmp_path, clock=lambda: 5.0) as writer:
+        signal = TrafficSignal(HeadlessGUI(), event_log=writer)
+        signal.lanes['lane1'].update(3)
+        signal.lanes['lane2'].update(10)
+    assert list(demand_from_log(tmp_path, lane_count=4).arrivals[0]) == [3, 10, 0, 0]
@@ -0,0 +1,105 @@
+import time
+
+import numpy as np
+
+from traffic_controller import HeadlessGUI, TrafficSignal
+from traffic_log import (EMERGENCY, EVENT_DTYPE, HEADER_SIZE, LANE_STATUS, PEDESTRIAN,
+                         PHASE_CHANGE, EventLogReader, EventLogWriter)
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+def test_round_trip_with_rotation(tmp_path):
+    with EventLogWriter(tmp_path, max_file_size=HEADER_SIZE + EVENT_DTYPE.itemsize * 4, flush_interval=0.01) as writer:
+        for i in range(10):
+            writer.log(PHASE_CHANGE, phase=i, vehicle_count=i * 2, duration=i)
+        writer.log_lane_status(np.array([1, 2, 3]), np.array([4, 5, 6]))
+
+    reader = EventLogReader(tmp_path)
+    assert len(reader.segments()) == 4
+    assert isinstance(reader.open_segment(reader.segments()[0]), np.memmap)
+    events = reader.read()
+    assert len(events) == 13
+    phases = reader.read(PHASE_CHANGE)
+    assert list(phases['phase']) == list(range(10))
+    assert list(phases['vehicle_count']) == [i * 2 for i in range(10)]
+    status = reader.read(LANE_STATUS)
+    assert list(status['lane']) == [0, 1, 2]
+    assert list(status['waiting_time']) == [4, 5, 6]
+
+def test_new_writer_continues_segment_numbering(tmp_path):
+    with EventLogWriter(tmp_path) as writer:
+        writer.log(PEDESTRIAN)
+    with EventLogWriter(tmp_path) as writer:
+        writer.log(EMERGENCY, lane=2)
+    reader = EventLogReader(tmp_path)
+    assert [path[-10:] for path in reader.segments()] == ["000000.bin", "000001.bin"]
+    assert list(reader.read()['kind']) == [PEDESTRIAN, EMERGENCY]
+
+def test_reader_ignores_partial_last_record(tmp_path):
+    with EventLogWriter(tmp_path) as writer:
+        writer.log(PEDESTRIAN)
+        writer.log(PEDESTRIAN)
+    path = EventLogReader(tmp_path).segments()[0]
+    with open(path, 'ab') as f:
+        f.write(b'\x00' * 5)
+    assert len(EventLogReader(tmp_path).read()) == 2
+
+def test_out_of_range_fields_are_clipped(tmp_path):
+    with EventLogWriter(tmp_path, flush_interval=0.01) as writer:
+        writer.log(PHASE_CHANGE, phase=40000, vehicle_count=2 ** 40)
+        writer.log(PEDESTRIAN)
+        assert writer.thread.is_alive()
+    events = EventLogReader(tmp_path).read()
+    assert events['phase'][0] == 2 ** 15 - 1
+    assert events['vehicle_count'][0] == 2 ** 31 - 1
+    assert len(events) == 2
+
+def test_failed_batch_is_counted_and_writer_keeps_running(tmp_path):
+    writer = EventLogWriter(tmp_path, flush_interval=0.01)
+    writer.pending.put(("not a timestamp",) * 8)
+    deadline = time.monotonic() + 10
+    while writer.dropped_records == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert writer.dropped_records == 1
+    assert writer.thread.is_alive()
+    writer.log(PEDESTRIAN)
+    writer.close()
+    assert list(EventLogReader(tmp_path).read()['kind']) == [PEDESTRIAN]
+
+def test_disk_error_counts_only_unwritten_records(tmp_path):
+    writer = EventLogWriter(tmp_path, max_file_size=HEADER_SIZE + EVENT_DTYPE.itemsize * 4)
+    writer.close()
+    writer.rotate()
+
+    # The first segment takes four records, then opening the next one fails
+    def failing_rotate():
+        raise OSError("disk full")
+
+    writer.rotate = failing_rotate
+    records = np.zeros(10, dtype=EVENT_DTYPE)
+    records['kind'] = PEDESTRIAN
+    writer.write_items([records])
+    assert writer.written_records == 4
+    assert writer.dropped_records == 6
+    assert isinstance(writer.last_error, OSError)
+    assert len(EventLogReader(tmp_path).read()) == 4
+
+def test_phase_change_records_actual_green_time(tmp_path):
+    clock = FakeClock()
+    with EventLogWriter(tmp_path, clock=clock) as writer:
+        signal = TrafficSignal(HeadlessGUI(), sleep=clock.sleep, event_log=writer)
+        signal.update_counts([3, 10, 7, 2])
+        signal.run_cycle()
+    phases = EventLogReader(tmp_path).read(PHASE_CHANGE)
+    # Lanes 1 and 4 get count x 5 seconds, then lane 2 drains its 10 vehicles
+    assert list(phases['phase']) == [0, 3, 1]
+    assert list(phases['duration']) == [15, 10, 10]
+    assert phases['timestamp'][2] == 1025
@@ -0,0 +1,56 @@
+import numpy as np
+
+from traffic_controller import HeadlessGUI, JunctionConfig, TrafficSignal
+from traffic_log import EMERGENCY, LANE_COUNT, EventLogReader, EventLogWriter
+from traffic_workload import LoadReport, TrafficWorkload, run_load_test
+
+def headless_signal(lanes=4, **kwargs):
+    return TrafficSignal(HeadlessGUI(), JunctionConfig.with_approaches(lanes), sleep=lambda seconds: None, **kwargs)
+
+def test_same_seed_gives_same_workload():
+    first = TrafficWorkload(4, seed=7).next_batch(5000)
+    second = TrafficWorkload(4, seed=7).next_batch(5000)
+    assert np.array_equal(first.arrivals, second.arrivals)
+    assert np.array_equal(first.emergency_lanes, second.emergency_lanes)
+    assert np.array_equal(first.pedestrians, second.pedestrians)
+
+def test_batches_cover_requested_steps_in_time_order():
+    workload = TrafficWorkload(3, seed=1)
+    batches = list(workload.batches(2500, batch_size=1000))
+    assert [len(batch) for batch in batches] == [1000, 1000, 500]
+    times = np.concatenate([batch.times for batch in batches])
+    assert np.array_equal(times, np.arange(2500, dtype=np.float64))
+
+def test_select_phase_mode_counts_only_lane_events():
+    report = run_load_test(headless_signal(), TrafficWorkload(4, seed=2, emergency_probability=0.5), 1000)
+    assert report.events == 4000
+    assert report.controller_time <= report.elapsed
+
+def test_full_cycle_passes_emergency_lane(tmp_path):
+    workload = TrafficWorkload(4, seed=3, emergency_probability=1.0, pedestrian_probability=0)
+    expected = workload.next_batch(20).emergency_lanes
+    with EventLogWriter(tmp_path) as writer:
+        signal = headless_signal(event_log=writer)
+        run_load_test(signal, TrafficWorkload(4, seed=3, emergency_probability=1.0, pedestrian_probability=0),
+                      20, full_cycle=True)
+    assert list(EventLogReader(tmp_path).read(EMERGENCY)['lane']) == list(expected)
+
+def test_empty_report_summary():
+    report = LoadReport(0, 0, 0.0, 0.0, np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64))
+    assert "0 steps" in report.summary()
+
+def test_load_test_feeds_arrivals_through_controller(tmp_path):
+    workload = TrafficWorkload(4, seed=4, arrival_rate=1.0, emergency_probability=0, pedestrian_probability=0)
+    with EventLogWriter(tmp_path) as writer:
+        report = run_load_test(headless_signal(event_log=writer), workload, 50)
+    assert len(EventLogReader(tmp_path).read(LANE_COUNT)) == 50 * 4
+    assert report.controller_time > report.decision_ns.sum() / 1e9
+    assert report.controller_time <= report.elapsed
+
+def test_add_arrivals_keeps_waiting_times():
+    signal = headless_signal()
+    signal.state.waiting_times[:] = 3
+    signal.add_arrivals(np.array([1, 0, 2, 0]))
+    signal.add_arrivals(np.array([1, 1, 0, 0]))
+    assert list(signal.state.vehicle_counts) == [2, 1, 2, 0]
+    assert list(signal.state.waiting_times) == [3, 3, 3, 3]
@@ -0,0 +1,225 @@
+import time
+import numpy as np
+
+from traffic_log import EMERGENCY, LANE_COUNT, PEDESTRIAN, PHASE_CHANGE
+
+# Junction layout and timing used by a TrafficSignal controller
+class JunctionConfig:
+    def __init__(self, lane_names, phases=None, emergency_lane=0, yellow_time=0,
+                 less_congested_threshold=5, green_time_per_vehicle=5,
+                 max_green_time=100, pedestrian_time=60, emergency_time=10):
+        self.lane_names = list(lane_names)
+        self.lane_keys = [f'lane{i+1}' for i in range(len(self.lane_names))]
+        # Each phase is a group of lane indices that get green together
+        if phases is None:
+            phases = [[i] for i in range(len(self.lane_names))]
+        self.phases = [list(phase) for phase in phases]
+        for phase in self.phases:
+            if not phase:
+                raise ValueError("Every phase needs at least one lane.")
+            for lane_index in phase:
+                if not 0 <= lane_index < len(self.lane_names):
+                    raise ValueError(f"Phase refers to unknown lane index {lane_index}.")
+        self.emergency_lane = emergency_lane
+        self.yellow_time = yellow_time
+        self.less_congested_threshold = less_congested_threshold
+        self.green_time_per_vehicle = green_time_per_vehicle
+        self.max_green_time = max_green_time
+        self.pedestrian_time = pedestrian_time
+        self.emergency_time = emergency_time
+
+    # phase_matrix[p, l] is 1 when lane l is green during phase p
+    def phase_matrix(self):
+        matrix = np.zeros((len(self.phases), len(self.lane_names)), dtype=np.int64)
+        for phase_index, phase in enumerate(self.phases):
+            matrix[phase_index, phase] = 1
+        return matrix
+
+    # Junction with `count` approaches, one phase per approach
+    @classmethod
+    def with_approaches(cls, count, **kwargs):
+        return cls([f'Lane {i+1}' for i in range(count)], **kwargs)
+
+# Per-lane counters kept in contiguous arrays, indexed by lane position
+class LaneState:
+    __slots__ = ('vehicle_counts', 'waiting_times')
+
+    def __init__(self, lane_count):
+        self.vehicle_counts = np.zeros(lane_count, dtype=np.int64)
+        self.waiting_times = np.zeros(lane_count, dtype=np.int64)
+
+# Named view onto one lane of a LaneState
+class Lane:
+    __slots__ = ('name', 'state', 'index', 'signal')
+
+    def __init__(self, name, state, index, signal=None):
+        self.name = name
+        self.state = state
+        self.index = index
+        self.signal = signal
+
+    @property
+    def vehicle_count(self):
+        return int(self.state.vehicle_counts[self.index])
+
+    @vehicle_count.setter
+    def vehicle_count(self, vehicles):
+        self.state.vehicle_counts[self.index] = vehicles
+
+    @property
+    def waiting_time(self):
+        return int(self.state.waiting_times[self.index])
+
+    def update(self, vehicles):
+        self.state.vehicle_counts[self.index] = vehicles
+        self.state.waiting_times[self.index] = 0
+        if self.signal is not None:
+            self.signal.log_event(LANE_COUNT, lane=self.index, vehicle_count=vehicles)
+
+    def increment_waiting_time(self):
+        self.state.waiting_times[self.index] += 1
+
+# Stand-in for TrafficSignalGUI when a controller runs without a window
+class HeadlessGUI:
+    def update_status(self, status):
+        pass
+
+    def set_signal(self, color, lane_names):
+        pass
+
+# TrafficSignal class for managing traffic flow logic on any junction layout
+class TrafficSignal:
+    def __init__(self, gui, config=None, sleep=time.sleep, event_log=None):
+        self.config = config or JunctionConfig.with_approaches(4)
+        self.gui = gui
+        self.sleep = sleep
+        self.event_log = event_log
+        self.state = LaneState(len(self.config.lane_names))
+        self.lanes = {
+            key: Lane(name, self.state, i, self)
+            for i, (key, name) in enumerate(zip(self.config.lane_keys, self.config.lane_names))
+        }
+        self.phase_matrix = self.config.phase_matrix()
+        # With one lane per phase in lane order the demand is just the lane counts
+        self.one_lane_phases = self.config.phases == [[i] for i in range(len(self.lanes))]
+        self.phase_lanes = [np.array(phase, dtype=np.intp) for phase in self.config.phases]
+        self.phase_keys = [[self.config.lane_keys[i] for i in phase] for phase in self.config.phases]
+        self.emergency_waiting = False
+        # Lane of the reported emergency; None means config.emergency_lane
+        self.emergency_lane = None
+        self.pedestrian_waiting = False
+
+    # Record an event if an EventLogWriter is attached
+    def log_event(self, kind, **fields):
+        if self.event_log is not None:
+            self.event_log.log(kind, **fields)
+
+    def phase_name(self, phase_index):
+        return " + ".join(self.config.lane_names[i] for i in self.config.phases[phase_index])
+
+    # Set every lane count at once (scalars are broadcast to all lanes)
+    def update_counts(self, vehicles):
+        self.state.vehicle_counts[:] = vehicles
+        self.state.waiting_times[:] = 0
+        if self.event_log is not None:
+            self.event_log.log_lanes(LANE_COUNT, self.state.vehicle_counts)
+
+    # Add newly arrived vehicles to the queues; waiting times keep running
+    def add_arrivals(self, arrivals):
+        self.state.vehicle_counts += arrivals
+        if self.event_log is not None:
+            self.event_log.log_lanes(LANE_COUNT, self.state.vehicle_counts)
+
+    # Queued vehicles per phase
+    def phase_demand(self):
+        if self.one_lane_phases:
+            return self.state.vehicle_counts
+        return self.phase_matrix @ self.state.vehicle_counts
+
+    # Index of the phase with the most queued vehicles
+    def select_phase(self):
+        return int(np.argmax(self.phase_demand()))
+
+    def report_emergency(self, lane_index=None):
+        self.emergency_waiting = True
+        self.emergency_lane = lane_index
+
+    def set_green(self, lane_keys):
+        if self.config.yellow_time:
+            self.gui.set_signal("yellow", lane_keys)
+            self.sleep(self.config.yellow_time)
+        self.gui.set_signal("green", lane_keys)
+
+    # Emergency vehicle priority logic
+    def emergency_vehicle_priority(self):
+        if self.emergency_waiting:
+            lane_index = self.config.emergency_lane if self.emergency_lane is None else self.emergency_lane
+            lane_key = self.config.lane_keys[lane_index]
+            self.gui.update_status(f"Emergency vehicle detected. Giving green signal for {self.config.emergency_time} seconds.")
+            self.log_event(EMERGENCY, lane=lane_index, duration=self.config.emergency_time)
+            self.gui.set_signal("green", lane_key)
+            self.sleep(self.config.emergency_time)
+            self.gui.set_signal("red", lane_key)
+            self.emergency_waiting = False
+            self.emergency_lane = None
+
+    # Less congested lane priority logic
+    def less_congested_lane_priority(self):
+        demand = self.phase_demand()
+        for phase_index in np.flatnonzero(demand < self.config.less_congested_threshold):
+            green_time = int(demand[phase_index]) * self.config.green_time_per_vehicle
+            lane_keys = self.phase_keys[phase_index]
+            self.gui.update_status(f"Giving green signal to {self.phase_name(phase_index)} for {green_time} seconds.")
+            self.log_event(PHASE_CHANGE, phase=int(phase_index), vehicle_count=int(demand[phase_index]), duration=green_time)
+            self.set_green(lane_keys)
+            self.sleep(green_time)
+            self.state.vehicle_counts[self.phase_lanes[phase_index]] = 0
+            self.gui.set_signal("red", lane_keys)
+
+    # Most congested lane priority logic
+    def most_congested_lane_priority(self):
+        phase_index = self.select_phase()
+        lanes = self.phase_lanes[phase_index]
+        lane_keys = self.phase_keys[phase_index]
+        counts = self.state.vehicle_counts
+        self.gui.update_status(f"Giving green signal to {self.phase_name(phase_index)} for up to {self.config.max_green_time} seconds.")
+        vehicles = int(counts[lanes].sum())
+        started = self.event_log.clock() if self.event_log is not None else None
+        self.set_green(lane_keys)
+        green_time = 0
+        for _ in range(self.config.max_green_time):
+            if not counts[lanes].any():
+                break
+            self.sleep(1)
+            green_time += 1
+            counts[lanes] = np.maximum(counts[lanes] - 1, 0)
+        self.gui.set_signal("red", lane_keys)
+        # Logged once the green ends so the record carries the time actually spent in green
+        self.log_event(PHASE_CHANGE, phase=phase_index, vehicle_count=vehicles, duration=green_time, timestamp=started)
+
+    # Pedestrian crossing priority
+    def pedestrian_priority(self):
+        if self.pedestrian_waiting:
+            self.gui.update_status(f"Pedestrian crossing active. All lanes red for {self.config.pedestrian_time} seconds.")
+            self.log_event(PEDESTRIAN, duration=self.config.pedestrian_time)
+            self.gui.set_signal("red", "all")
+            self.sleep(self.config.pedestrian_time)
+            self.pedestrian_waiting = False
+
+    # Update lane status (for display)
+    def update_lane_status(self):
+        self.state.waiting_times += 1
+        if self.event_log is not None:
+            self.event_log.log_lane_status(self.state.vehicle_counts, self.state.waiting_times)
+        status = ""
+        for lane in self.lanes.values():
+            status += f"{lane.name}: {lane.vehicle_count} vehicles, {lane.waiting_time}s wait.\n"
+        self.gui.update_status(status)
+
+    # Main cycle of traffic signal control
+    def run_cycle(self):
+        self.emergency_vehicle_priority()
+        self.less_congested_lane_priority()
+        self.most_congested_lane_priority()
+        self.pedestrian_priority()
+        self.update_lane_status()
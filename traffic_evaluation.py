@@ -0,0 +1,200 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+from traffic_controller import JunctionConfig
+from traffic_log import EMERGENCY, LANE_COUNT, LANE_STATUS, PEDESTRIAN, EventLogReader
+from traffic_policies import ALL_RED, default_policies
+from traffic_workload import TrafficWorkload, WorkloadBatch
+
+# Metrics for one policy over one demand trace
+class PolicyResult:
+    def __init__(self, name, simulated_seconds, arrived, departed, total_delay, max_queue,
+                 decisions, decision_cpu_ns, wall_time):
+        self.name = name
+        self.simulated_seconds = simulated_seconds
+        self.arrived = arrived
+        self.departed = departed
+        self.total_delay = total_delay
+        self.max_queue = max_queue
+        self.decisions = decisions
+        self.decision_cpu_ns = decision_cpu_ns
+        self.wall_time = wall_time
+
+    # Vehicle-seconds spent queueing per arriving vehicle
+    @property
+    def average_delay(self):
+        return self.total_delay / self.arrived if self.arrived else 0.0
+
+    @property
+    def throughput_per_hour(self):
+        return self.departed * 3600 / self.simulated_seconds if self.simulated_seconds else 0.0
+
+    @property
+    def decision_cpu_us(self):
+        return self.decision_cpu_ns / self.decisions / 1000 if self.decisions else 0.0
+
+# Queue model: each green lane discharges `saturation_flow` vehicles per second,
+# and every change of green phase costs `lost_time` seconds of all red.
+# Emergency and pedestrian events pre-empt the policy at its next decision
+# using the emergency_time and pedestrian_time of the junction config.
+def simulate(policy, config, demand, saturation_flow=0.5, lost_time=3):
+    wall_start = time.perf_counter()
+    arrivals = demand.arrivals.astype(np.float64)
+    steps, lane_count = arrivals.shape
+    if lane_count != len(config.lane_names):
+        raise ValueError("Demand and junction config have a different number of lanes.")
+    phase_lanes = [np.array(phase, dtype=np.intp) for phase in config.phases]
+    emergency_steps = np.flatnonzero(demand.emergency_lanes >= 0)
+    pedestrian_steps = np.flatnonzero(demand.pedestrians)
+
+    policy.reset(config, saturation_flow, lost_time)
+    queues = np.zeros(lane_count)
+    arrived = np.zeros(lane_count)
+    total_delay = 0.0
+    max_queue = 0.0
+    decisions = 0
+    decision_cpu_ns = 0
+    current_lanes = None
+    seen = 0
+    pedestrian_waiting = False
+
+    # Advance up to `duration` seconds with `green_lanes` discharging
+    def advance(start, duration, green_lanes, gap_out):
+        nonlocal queues, total_delay, max_queue
+        end = min(start + duration, steps)
+        if end <= start:
+            return start
+        step_arrivals = arrivals[start:end]
+        net = step_arrivals.copy()
+        if green_lanes is not None:
+            net[:, green_lanes] -= saturation_flow
+        # Lindley recursion q[t] = max(q[t-1] + net[t], 0) in closed form
+        totals = queues + np.cumsum(net, axis=0)
+        history = totals - np.minimum(np.minimum.accumulate(totals, axis=0), 0)
+        if gap_out and green_lanes is not None:
+            empty = np.flatnonzero((history[:, green_lanes] <= 0).all(axis=1))
+            if len(empty):
+                history = history[:empty[0] + 1]
+                step_arrivals = step_arrivals[:empty[0] + 1]
+        arrived[:] += step_arrivals.sum(axis=0)
+        total_delay += float(history.sum())
+        max_queue = max(max_queue, float(history.max()))
+        queues = history[-1].copy()
+        return start + len(history)
+
+    step = 0
+    while step < steps:
+        emergency_lane = -1
+        upcoming = emergency_steps[np.searchsorted(emergency_steps, seen):np.searchsorted(emergency_steps, step, side='right')]
+        if len(upcoming):
+            emergency_lane = int(demand.emergency_lanes[upcoming[-1]])
+        # A crossing stays pending until served, like TrafficSignal.pedestrian_waiting
+        if np.searchsorted(pedestrian_steps, step, side='right') > np.searchsorted(pedestrian_steps, seen):
+            pedestrian_waiting = True
+        seen = step + 1
+
+        if emergency_lane >= 0:
+            green_lanes, duration, gap_out = np.array([emergency_lane]), config.emergency_time, False
+        elif pedestrian_waiting:
+            green_lanes, duration, gap_out = None, config.pedestrian_time, False
+            pedestrian_waiting = False
+        else:
+            decision_start = time.thread_time_ns()
+            phase_index, duration, gap_out = policy.decide(step, queues, arrived)
+            decision_cpu_ns += time.thread_time_ns() - decision_start
+            decisions += 1
+            green_lanes = None if phase_index == ALL_RED else phase_lanes[phase_index]
+
+        if green_lanes is not None and current_lanes is not None and lost_time \
+                and not np.array_equal(green_lanes, current_lanes):
+            step = advance(step, lost_time, None, False)
+        if green_lanes is not None:
+            current_lanes = green_lanes
+        step = advance(step, max(int(duration), 1), green_lanes, gap_out)
+
+    departed = float(arrived.sum() - queues.sum())
+    return PolicyResult(policy.name, steps, float(arrived.sum()), departed, total_delay, max_queue,
+                        decisions, decision_cpu_ns, time.perf_counter() - wall_start)
+
+def _simulate_task(task):
+    return simulate(*task)
+
+# Run every policy on the same demand, one process per policy
+def evaluate_policies(policies, config, demand, saturation_flow=0.5, lost_time=3, workers=None):
+    tasks = [(policy, config, demand, saturation_flow, lost_time) for policy in policies]
+    workers = workers or min(len(tasks), os.cpu_count() or 1)
+    if workers <= 1:
+        return [_simulate_task(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_simulate_task, tasks))
+
+# Rebuild a one-second demand trace from the lane counts a controller observed.
+# Arrivals at each LANE_COUNT observation are the vehicles above what the lane still
+# held at its previous record: the last LANE_STATUS (queue left after the controller
+# served it) or the previous observation. Logs written before LANE_COUNT existed
+# cannot be rebuilt. lane_count defaults to the highest lane seen in the log.
+def demand_from_log(directory, lane_count=None):
+    events = EventLogReader(directory).read()
+    lane_events = events[(events['kind'] == LANE_COUNT) | (events['kind'] == LANE_STATUS)]
+    if not np.any(lane_events['kind'] == LANE_COUNT):
+        raise ValueError(f"No observed lane count records in {directory}.")
+    if lane_count is None:
+        lane_count = int(lane_events['lane'].max()) + 1
+    order = np.lexsort((np.arange(len(lane_events)), lane_events['timestamp'], lane_events['lane']))
+    lane_events = lane_events[order]
+    values = lane_events['vehicle_count'].astype(np.int64)
+    previous = np.concatenate(([0], values[:-1]))
+    previous[np.flatnonzero(np.diff(lane_events['lane'])) + 1] = 0
+    observed = lane_events['kind'] == LANE_COUNT
+    observations = lane_events[observed]
+    increases = np.maximum(values[observed] - previous[observed], 0)
+
+    start = observations['timestamp'].min()
+    steps = int(lane_events['timestamp'].max() - start) + 1
+    arrivals = np.zeros((steps, lane_count), dtype=np.int64)
+    np.add.at(arrivals, ((observations['timestamp'] - start).astype(np.intp), observations['lane']), increases)
+
+    emergency_lanes = np.full(steps, -1, dtype=np.int64)
+    emergencies = events[(events['kind'] == EMERGENCY) & (events['timestamp'] >= start)
+                         & (events['timestamp'] < start + steps)]
+    emergency_lanes[(emergencies['timestamp'] - start).astype(np.intp)] = emergencies['lane']
+    pedestrians = np.zeros(steps, dtype=bool)
+    crossings = events[(events['kind'] == PEDESTRIAN) & (events['timestamp'] >= start)
+                       & (events['timestamp'] < start + steps)]
+    pedestrians[(crossings['timestamp'] - start).astype(np.intp)] = True
+    return WorkloadBatch(start + np.arange(steps, dtype=np.float64), arrivals, emergency_lanes, pedestrians)
+
+def format_results(results):
+    lines = [f"{'policy':<20}{'avg delay s':>12}{'veh/h':>10}{'max queue':>11}{'decisions':>11}{'cpu us/dec':>12}"]
+    for result in sorted(results, key=lambda result: result.average_delay):
+        lines.append(f"{result.name:<20}{result.average_delay:>12.1f}{result.throughput_per_hour:>10.0f}"
+                     f"{result.max_queue:>11.0f}{result.decisions:>11}{result.decision_cpu_us:>12.2f}")
+    return "\n".join(lines)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare signal policies on replayed or synthetic traffic.")
+    parser.add_argument("--log-dir", help="Replay demand from an event log instead of generating it")
+    parser.add_argument("--lanes", type=int, default=4)
+    parser.add_argument("--hours", type=float, default=24)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--arrival-rate", type=float, default=0.05, help="Vehicles per lane per second at profile 1.0")
+    parser.add_argument("--emergencies-per-hour", type=float, default=1)
+    parser.add_argument("--pedestrians-per-hour", type=float, default=6)
+    parser.add_argument("--saturation-flow", type=float, default=0.5, help="Vehicles per green lane per second")
+    parser.add_argument("--lost-time", type=int, default=3, help="All-red seconds on every phase change")
+    parser.add_argument("--workers", type=int)
+    args = parser.parse_args()
+
+    if args.log_dir:
+        demand = demand_from_log(args.log_dir)
+    else:
+        workload = TrafficWorkload(args.lanes, seed=args.seed, arrival_rate=args.arrival_rate,
+                                   emergency_probability=args.emergencies_per_hour / 3600,
+                                   pedestrian_probability=args.pedestrians_per_hour / 3600)
+        demand = workload.next_batch(int(args.hours * 3600))
+    config = JunctionConfig.with_approaches(demand.arrivals.shape[1])
+    results = evaluate_policies(default_policies(), config, demand, args.saturation_flow, args.lost_time, args.workers)
+    print(format_results(results))
@@ -0,0 +1,102 @@
+import math
+import threading
+import time
+import tkinter as tk
+
+from traffic_controller import JunctionConfig, TrafficSignal
+from traffic_log import EventLogWriter
+
+# Spread `count` signal heads around the centre of the window
+def default_lane_positions(count, width=600, height=500):
+    positions = []
+    for i in range(count):
+        angle = 2 * math.pi * i / count - math.pi / 2
+        positions.append((int(width / 2 - 25 + math.cos(angle) * (width / 2 - 75)),
+                          int(height / 2 - 50 + math.sin(angle) * (height / 2 - 75))))
+    return positions
+
+# GUI class for managing the visual representation of the traffic signals
+class TrafficSignalGUI:
+    # Demo front-ends opt in to a simulated emergency on every cycle
+    demo_emergency_every_cycle = False
+
+    def __init__(self, root, config=None, lane_positions=None, geometry="600x500",
+                 status_place=(150, 200, 300, 100), button_place=(250, 320, 100, 40),
+                 event_log_dir=None):
+        self.root = root
+        self.root.title("Traffic Signal Management")
+        self.root.geometry(geometry)
+        self.root.configure(bg="#2c3e50")
+
+        config = config or JunctionConfig.with_approaches(4)
+        if lane_positions is None:
+            width, height = (int(v) for v in geometry.split("x"))
+            lane_positions = default_lane_positions(len(config.lane_keys), width, height)
+
+        self.signals = {}
+        for lane_key, (x, y) in zip(config.lane_keys, lane_positions):
+            frame = tk.Frame(root, bg="#2c3e50")
+            frame.place(x=x, y=y)
+            self.signals[lane_key] = {
+                'red': tk.Label(frame, bg="grey", width=5, height=2),
+                'yellow': tk.Label(frame, bg="grey", width=5, height=2),
+                'green': tk.Label(frame, bg="grey", width=5, height=2)
+            }
+            self.signals[lane_key]['red'].pack(pady=2)
+            self.signals[lane_key]['yellow'].pack(pady=2)
+            self.signals[lane_key]['green'].pack(pady=2)
+
+        x, y, width, height = status_place
+        self.status_label = tk.Label(root, text="Status: ", anchor="w", justify="left", bg="#ecf0f1", fg="#2c3e50", font=("Helvetica", 10), padx=5, pady=5)
+        self.status_label.place(x=x, y=y, width=width, height=height)
+
+        x, y, width, height = button_place
+        self.start_button = tk.Button(root, text="Start", command=self.start_traffic_signal, bg="#27ae60", fg="#ecf0f1", font=("Helvetica", 12), padx=5, pady=5)
+        self.start_button.place(x=x, y=y, width=width, height=height)
+
+        self.traffic_signal = self.create_traffic_signal(config)
+        if event_log_dir is not None:
+            self.traffic_signal.event_log = EventLogWriter(event_log_dir)
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
+
+    # Flush queued log events before the window goes away
+    def close(self):
+        if self.traffic_signal.event_log is not None:
+            self.traffic_signal.event_log.close()
+        self.root.destroy()
+
+    def create_traffic_signal(self, config):
+        return TrafficSignal(self, config)
+
+    def update_status(self, status):
+        self.status_label.config(text=f"Status: \n{status}")
+
+    # lane_names is "all", a single lane key or a list of lane keys
+    def set_signal(self, color, lane_names):
+        if isinstance(lane_names, str):
+            lane_names = [lane_names]
+        for signal_name, signal in self.signals.items():
+            if "all" in lane_names or signal_name in lane_names:
+                signal['red'].config(bg="grey")
+                signal['yellow'].config(bg="grey")
+                signal['green'].config(bg="grey")
+                if color == "red":
+                    signal['red'].config(bg="red")
+                elif color == "yellow":
+                    signal['yellow'].config(bg="yellow")
+                elif color == "green":
+                    signal['green'].config(bg="green")
+            else:
+                signal['red'].config(bg="red")
+                signal['yellow'].config(bg="grey")
+                signal['green'].config(bg="grey")
+
+    def start_traffic_signal(self):
+        threading.Thread(target=self.run_traffic_signal, daemon=True).start()
+
+    def run_traffic_signal(self):
+        while True:
+            if self.demo_emergency_every_cycle:
+                self.traffic_signal.report_emergency()
+            self.traffic_signal.run_cycle()
+            time.sleep(1)
@@ -0,0 +1,224 @@
+import os
+import queue
+import threading
+import time
+import numpy as np
+
+# Event kinds stored in the `kind` field of every record
+PHASE_CHANGE = 1
+LANE_STATUS = 2
+EMERGENCY = 3
+PEDESTRIAN = 4
+# Per-lane vehicle count as observed (camera or operator), before the controller acts on it
+LANE_COUNT = 5
+
+EVENT_NAMES = {
+    PHASE_CHANGE: "phase_change",
+    LANE_STATUS: "lane_status",
+    EMERGENCY: "emergency",
+    PEDESTRIAN: "pedestrian",
+    LANE_COUNT: "lane_count",
+}
+
+# Fixed-size little-endian record, 32 bytes
+EVENT_DTYPE = np.dtype([
+    ('timestamp', '<f8'),
+    ('kind', '<u2'),
+    ('lane', '<i2'),
+    ('phase', '<i2'),
+    ('reserved', '<u2'),
+    ('vehicle_count', '<i4'),
+    ('waiting_time', '<i4'),
+    ('duration', '<f4'),
+])
+
+MAGIC = b'TSEVLOG1'
+HEADER_SIZE = 16
+HEADER = MAGIC + EVENT_DTYPE.itemsize.to_bytes(4, 'little') + bytes(4)
+
+def segment_paths(directory):
+    names = sorted(name for name in os.listdir(directory)
+                   if name.startswith("events-") and name.endswith(".bin"))
+    return [os.path.join(directory, name) for name in names]
+
+INT16_RANGE = (-2 ** 15, 2 ** 15 - 1)
+INT32_RANGE = (-2 ** 31, 2 ** 31 - 1)
+
+def clip(value, value_range):
+    return min(max(int(value), value_range[0]), value_range[1])
+
+# Buffered writer that never blocks the caller; a background thread writes
+# everything queued once every flush_interval seconds
+class EventLogWriter:
+    def __init__(self, directory, max_file_size=64 * 1024 * 1024, flush_interval=1.0, clock=time.time):
+        if max_file_size < HEADER_SIZE + EVENT_DTYPE.itemsize:
+            raise ValueError("max_file_size is too small to hold a single record.")
+        self.directory = directory
+        self.max_file_size = max_file_size
+        self.flush_interval = flush_interval
+        self.clock = clock
+        os.makedirs(directory, exist_ok=True)
+
+        existing = segment_paths(directory)
+        self.segment_index = int(os.path.basename(existing[-1])[7:-4]) + 1 if existing else 0
+        self.file = None
+        self.file_size = 0
+
+        # Batches that could not be written are dropped and counted here
+        self.dropped_records = 0
+        # Records of the current batch already handed to the file
+        self.written_records = 0
+        self.last_error = None
+
+        self.pending = queue.SimpleQueue()
+        self.stopping = threading.Event()
+        self.closed = False
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    # Queue a single event; returns immediately. Out-of-range fields are clipped
+    # to the record's field widths.
+    def log(self, kind, lane=-1, phase=-1, vehicle_count=0, waiting_time=0, duration=0.0, timestamp=None):
+        if timestamp is None:
+            timestamp = self.clock()
+        self.pending.put((timestamp, kind, clip(lane, INT16_RANGE), clip(phase, INT16_RANGE), 0,
+                          clip(vehicle_count, INT32_RANGE), clip(waiting_time, INT32_RANGE), duration))
+
+    # Queue one record of `kind` per lane from the controller arrays
+    def log_lanes(self, kind, vehicle_counts, waiting_times=0):
+        records = np.zeros(len(vehicle_counts), dtype=EVENT_DTYPE)
+        records['timestamp'] = self.clock()
+        records['kind'] = kind
+        records['lane'] = np.arange(len(vehicle_counts))
+        records['phase'] = -1
+        records['vehicle_count'] = np.clip(vehicle_counts, *INT32_RANGE)
+        records['waiting_time'] = np.clip(waiting_times, *INT32_RANGE)
+        self.pending.put(records)
+
+    def log_lane_status(self, vehicle_counts, waiting_times):
+        self.log_lanes(LANE_STATUS, vehicle_counts, waiting_times)
+
+    # Write whatever is still queued and stop the background thread
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            self.stopping.set()
+            self.thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def run(self):
+        while True:
+            stop = self.stopping.wait(self.flush_interval)
+            items = []
+            while True:
+                try:
+                    items.append(self.pending.get_nowait())
+                except queue.Empty:
+                    break
+            self.write_items(items)
+            if stop:
+                if self.file is not None:
+                    self.file.close()
+                    self.file = None
+                return
+
+    # Write one drained batch; on failure count the records that did not reach
+    # the file and keep going
+    def write_items(self, items):
+        self.written_records = 0
+        try:
+            self.write(items)
+        except Exception as error:
+            # A bad batch or a failing disk must not kill the writer thread
+            total = sum(1 if isinstance(item, tuple) else len(item) for item in items)
+            self.dropped_records += total - self.written_records
+            self.last_error = error
+            if isinstance(error, OSError) and self.file is not None:
+                try:
+                    self.file.close()
+                except OSError:
+                    pass
+                self.file = None
+
+    def write(self, items):
+        if not items:
+            return
+        # Keep queue order while turning runs of single events into arrays
+        batches = []
+        tuples = []
+        for item in items:
+            if isinstance(item, tuple):
+                tuples.append(item)
+                continue
+            if tuples:
+                batches.append(np.array(tuples, dtype=EVENT_DTYPE))
+                tuples = []
+            batches.append(item)
+        if tuples:
+            batches.append(np.array(tuples, dtype=EVENT_DTYPE))
+        records = np.concatenate(batches) if len(batches) > 1 else batches[0]
+
+        start = 0
+        while start < len(records):
+            if self.file is None or self.file_size + EVENT_DTYPE.itemsize > self.max_file_size:
+                self.rotate()
+            room = (self.max_file_size - self.file_size) // EVENT_DTYPE.itemsize
+            chunk = records[start:start + room]
+            self.file.write(chunk.tobytes())
+            self.file_size += chunk.nbytes
+            self.written_records += len(chunk)
+            start += len(chunk)
+        self.file.flush()
+
+    def rotate(self):
+        if self.file is not None:
+            self.file.close()
+        path = os.path.join(self.directory, f"events-{self.segment_index:06d}.bin")
+        self.segment_index += 1
+        self.file = open(path, 'wb')
+        self.file.write(HEADER)
+        self.file_size = HEADER_SIZE
+
+# Read-only view of a log directory; each segment is memory-mapped, not parsed
+class EventLogReader:
+    def __init__(self, directory):
+        self.directory = directory
+
+    def segments(self):
+        return segment_paths(self.directory)
+
+    # Structured array backed by mmap; a partially written last record is ignored
+    @staticmethod
+    def open_segment(path):
+        with open(path, 'rb') as f:
+            header = f.read(HEADER_SIZE)
+        if header[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a traffic event log.")
+        if int.from_bytes(header[8:12], 'little') != EVENT_DTYPE.itemsize:
+            raise ValueError(f"{path} uses an unsupported record size.")
+        count = (os.path.getsize(path) - HEADER_SIZE) // EVENT_DTYPE.itemsize
+        if count == 0:
+            return np.zeros(0, dtype=EVENT_DTYPE)
+        return np.memmap(path, dtype=EVENT_DTYPE, mode='r', offset=HEADER_SIZE, shape=(count,))
+
+    def __iter__(self):
+        for path in self.segments():
+            yield self.open_segment(path)
+
+    # All segments as one array (copies unless there is only one segment)
+    def read(self, kind=None):
+        arrays = list(self)
+        if not arrays:
+            events = np.zeros(0, dtype=EVENT_DTYPE)
+        elif len(arrays) == 1:
+            events = arrays[0]
+        else:
+            events = np.concatenate(arrays)
+        if kind is not None:
+            events = events[events['kind'] == kind]
+        return events
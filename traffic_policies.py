@@ -0,0 +1,119 @@
+import numpy as np
+
+# Phase index meaning every lane is red
+ALL_RED = -1
+
+# Base class for signal strategies evaluated by traffic_evaluation.simulate.
+# decide() returns (phase_index, duration_seconds, gap_out); with gap_out the
+# green ends early once every lane of the phase is empty.
+class SignalPolicy:
+    name = "policy"
+
+    def reset(self, config, saturation_flow, lost_time):
+        self.config = config
+        self.saturation_flow = saturation_flow
+        self.lost_time = lost_time
+        self.phase_matrix = config.phase_matrix()
+
+    def phase_demand(self, queues):
+        return self.phase_matrix @ queues
+
+    def decide(self, time, queues, arrived):
+        raise NotImplementedError
+
+# The TrafficSignal.run_cycle heuristic: short green for lightly loaded phases,
+# then the most congested phase until it empties or max_green_time runs out
+class HeuristicPolicy(SignalPolicy):
+    name = "heuristic"
+
+    def reset(self, config, saturation_flow, lost_time):
+        super().reset(config, saturation_flow, lost_time)
+        self.plan = []
+
+    def decide(self, time, queues, arrived):
+        if not self.plan:
+            demand = self.phase_demand(queues)
+            for phase_index in np.flatnonzero(demand < self.config.less_congested_threshold):
+                green_time = int(np.ceil(demand[phase_index])) * self.config.green_time_per_vehicle
+                if green_time > 0:
+                    self.plan.append((int(phase_index), green_time, False))
+            self.plan.append(None)
+            # One idle second between cycles, as in the GUI loop
+            self.plan.append((ALL_RED, 1, False))
+        action = self.plan.pop(0)
+        if action is None:
+            phase_index = int(np.argmax(self.phase_demand(queues)))
+            action = (phase_index, self.config.max_green_time, True)
+        return action
+
+# Every phase in turn for a fixed green time
+class FixedTimePolicy(SignalPolicy):
+    def __init__(self, green_time=30):
+        self.green_time = green_time
+        self.name = f"fixed-{green_time}s"
+
+    def reset(self, config, saturation_flow, lost_time):
+        super().reset(config, saturation_flow, lost_time)
+        self.next_phase = 0
+
+    def decide(self, time, queues, arrived):
+        phase_index = self.next_phase
+        self.next_phase = (phase_index + 1) % len(self.config.phases)
+        return phase_index, self.green_time, False
+
+# Webster's optimal cycle, re-planned every cycle from the arrival rates seen in the last one
+class WebsterPolicy(SignalPolicy):
+    name = "webster"
+
+    def __init__(self, min_cycle=30, max_cycle=150, min_green=5):
+        self.min_cycle = min_cycle
+        self.max_cycle = max_cycle
+        self.min_green = min_green
+
+    def reset(self, config, saturation_flow, lost_time):
+        super().reset(config, saturation_flow, lost_time)
+        self.plan = []
+        self.plan_time = 0
+        self.plan_arrived = None
+
+    def cycle_plan(self, time, arrived):
+        phase_count = len(self.config.phases)
+        total_lost_time = self.lost_time * phase_count
+        if self.plan_arrived is None or time <= self.plan_time:
+            greens = np.full(phase_count, max((self.min_cycle - total_lost_time) / phase_count, self.min_green))
+        else:
+            rates = (arrived - self.plan_arrived) / (time - self.plan_time)
+            # Critical flow ratio of each phase is its busiest lane
+            ratios = (self.phase_matrix * rates[None, :]).max(axis=1) / self.saturation_flow
+            total_ratio = ratios.sum()
+            if total_ratio >= 0.95:
+                cycle = self.max_cycle
+            else:
+                cycle = np.clip((1.5 * total_lost_time + 5) / (1 - total_ratio), self.min_cycle, self.max_cycle)
+            effective_green = max(cycle - total_lost_time, self.min_green * phase_count)
+            if total_ratio > 0:
+                greens = effective_green * ratios / total_ratio
+            else:
+                greens = np.full(phase_count, effective_green / phase_count)
+            greens = np.maximum(greens, self.min_green)
+        self.plan_time = time
+        self.plan_arrived = arrived.copy()
+        return [(phase_index, int(round(green)), False) for phase_index, green in enumerate(greens)]
+
+    def decide(self, time, queues, arrived):
+        if not self.plan:
+            self.plan = self.cycle_plan(time, arrived)
+        return self.plan.pop(0)
+
+# Max-pressure: every interval, green for the phase with the largest queue
+# (downstream links are assumed to be empty, so pressure is the phase queue)
+class MaxPressurePolicy(SignalPolicy):
+    def __init__(self, interval=10):
+        self.interval = interval
+        self.name = f"max-pressure-{interval}s"
+
+    def decide(self, time, queues, arrived):
+        return int(np.argmax(self.phase_demand(queues))), self.interval, False
+
+def default_policies():
+    return [HeuristicPolicy(), FixedTimePolicy(30), WebsterPolicy(), MaxPressurePolicy(10)]
@@ -0,0 +1,202 @@
+import argparse
+import time
+import numpy as np
+
+from traffic_controller import HeadlessGUI, JunctionConfig, TrafficSignal
+
+# Relative arrival rate for each hour of the day, with morning and evening peaks
+DEFAULT_PROFILE = np.array([
+    0.20, 0.15, 0.10, 0.10, 0.15, 0.30, 0.70, 1.40, 1.60, 1.00, 0.80, 0.80,
+    0.90, 0.90, 0.80, 0.90, 1.10, 1.50, 1.60, 1.00, 0.70, 0.50, 0.40, 0.30,
+])
+
+# One block of simulated steps; row i of every array belongs to step i
+class WorkloadBatch:
+    __slots__ = ('times', 'arrivals', 'emergency_lanes', 'pedestrians')
+
+    def __init__(self, times, arrivals, emergency_lanes, pedestrians):
+        self.times = times
+        self.arrivals = arrivals
+        self.emergency_lanes = emergency_lanes
+        self.pedestrians = pedestrians
+
+    def __len__(self):
+        return len(self.times)
+
+    # Lane-count, emergency and pedestrian events contained in the batch
+    def event_count(self):
+        return (self.arrivals.size + int(np.count_nonzero(self.emergency_lanes >= 0))
+                + int(np.count_nonzero(self.pedestrians)))
+
+# Seeded generator of per-lane arrivals with Poisson demand, bursts and special events
+class TrafficWorkload:
+    def __init__(self, lane_count=4, seed=None, arrival_rate=0.3, lane_weights=None,
+                 profile=DEFAULT_PROFILE, step_seconds=1.0, start_time=0.0,
+                 burst_probability=0.01, burst_size=(5, 15),
+                 emergency_probability=0.001, pedestrian_probability=0.01):
+        self.lane_count = lane_count
+        self.rng = np.random.default_rng(seed)
+        if lane_weights is None:
+            lane_weights = np.ones(lane_count)
+        self.lane_weights = np.asarray(lane_weights, dtype=np.float64)
+        if self.lane_weights.shape != (lane_count,):
+            raise ValueError("lane_weights needs one entry per lane.")
+        self.profile = np.asarray(profile, dtype=np.float64)
+        self.arrival_rate = arrival_rate
+        self.step_seconds = step_seconds
+        self.time = start_time
+        self.burst_probability = burst_probability
+        self.burst_size = burst_size
+        self.emergency_probability = emergency_probability
+        self.pedestrian_probability = pedestrian_probability
+
+    # Expected arrivals per lane for each step starting at `times`
+    def arrival_means(self, times):
+        slot = (times // (86400 / len(self.profile))).astype(np.intp) % len(self.profile)
+        scale = self.arrival_rate * self.step_seconds * self.profile[slot]
+        return scale[:, None] * self.lane_weights[None, :]
+
+    def next_batch(self, steps):
+        times = self.time + np.arange(steps) * self.step_seconds
+        self.time += steps * self.step_seconds
+
+        arrivals = self.rng.poisson(self.arrival_means(times)).astype(np.int64)
+
+        burst_steps = np.flatnonzero(self.rng.random(steps) < self.burst_probability)
+        burst_lanes = self.rng.integers(self.lane_count, size=len(burst_steps))
+        burst_sizes = self.rng.integers(self.burst_size[0], self.burst_size[1] + 1, size=len(burst_steps))
+        np.add.at(arrivals, (burst_steps, burst_lanes), burst_sizes)
+
+        emergency_lanes = np.full(steps, -1, dtype=np.int64)
+        emergency_steps = np.flatnonzero(self.rng.random(steps) < self.emergency_probability)
+        emergency_lanes[emergency_steps] = self.rng.integers(self.lane_count, size=len(emergency_steps))
+
+        pedestrians = self.rng.random(steps) < self.pedestrian_probability
+        return WorkloadBatch(times, arrivals, emergency_lanes, pedestrians)
+
+    def batches(self, steps, batch_size=65536):
+        while steps > 0:
+            size = min(batch_size, steps)
+            steps -= size
+            yield self.next_batch(size)
+
+# Throughput and latency measured by run_load_test
+class LoadReport:
+    def __init__(self, steps, events, elapsed, generation_time, ingest_ns, decision_ns):
+        self.steps = steps
+        self.events = events
+        self.elapsed = elapsed
+        self.generation_time = generation_time
+        self.ingest_ns = ingest_ns
+        self.decision_ns = decision_ns
+
+    # Seconds spent inside the controller taking in events and deciding,
+    # without generation and harness work
+    @property
+    def controller_time(self):
+        return float(self.ingest_ns.sum() + self.decision_ns.sum()) / 1e9
+
+    @property
+    def controller_events_per_second(self):
+        return self.events / self.controller_time if self.controller_time else 0.0
+
+    # Generation, feeding and decisions together
+    @property
+    def end_to_end_events_per_second(self):
+        return self.events / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def generated_events_per_second(self):
+        return self.events / self.generation_time if self.generation_time else 0.0
+
+    @staticmethod
+    def percentile_us(latencies_ns, percentile):
+        if len(latencies_ns) == 0:
+            return 0.0
+        return float(np.percentile(latencies_ns, percentile)) / 1000
+
+    def latency_us(self, percentile):
+        return self.percentile_us(self.decision_ns, percentile)
+
+    def ingest_latency_us(self, percentile):
+        return self.percentile_us(self.ingest_ns, percentile)
+
+    def summary(self):
+        return (f"{self.steps} steps, {self.events} events in {self.elapsed:.2f}s\n"
+                f"Controller throughput (ingest + decision): {self.controller_events_per_second:,.0f} events/s\n"
+                f"End-to-end throughput: {self.end_to_end_events_per_second:,.0f} events/s\n"
+                f"Generator throughput: {self.generated_events_per_second:,.0f} events/s\n"
+                f"Ingest latency per step: p50 {self.ingest_latency_us(50):.2f}us, "
+                f"p99 {self.ingest_latency_us(99):.2f}us, max {self.ingest_latency_us(100):.2f}us\n"
+                f"Decision latency: p50 {self.latency_us(50):.2f}us, p99 {self.latency_us(99):.2f}us, "
+                f"max {self.latency_us(100):.2f}us")
+
+# Feed `steps` of workload into a controller as fast as it takes them. Every step
+# goes in through TrafficSignal.add_arrivals; ingest and decision are timed separately.
+# With full_cycle the decision is the whole TrafficSignal.run_cycle (give the
+# controller a no-op sleep) and emergency and pedestrian events are passed to it.
+# Otherwise the decision is select_phase, the chosen phase then discharges up to
+# `discharge` vehicles per lane, and only lane-count events are counted since
+# nothing handles the others.
+def run_load_test(controller, workload, steps, batch_size=65536, full_cycle=False, discharge=1):
+    counts = controller.state.vehicle_counts
+    ingest_ns = np.empty(steps, dtype=np.int64)
+    decision_ns = np.empty(steps, dtype=np.int64)
+    events = 0
+    generation_time = 0.0
+    step = 0
+    perf_counter_ns = time.perf_counter_ns
+
+    start = time.perf_counter()
+    batches = workload.batches(steps, batch_size)
+    while True:
+        generation_start = time.perf_counter()
+        batch = next(batches, None)
+        generation_time += time.perf_counter() - generation_start
+        if batch is None:
+            break
+        if full_cycle:
+            events += batch.event_count()
+            for arrivals, emergency_lane, pedestrian in zip(batch.arrivals, batch.emergency_lanes, batch.pedestrians):
+                ingest_start = perf_counter_ns()
+                controller.add_arrivals(arrivals)
+                if emergency_lane >= 0:
+                    controller.report_emergency(int(emergency_lane))
+                if pedestrian:
+                    controller.pedestrian_waiting = True
+                decision_start = perf_counter_ns()
+                controller.run_cycle()
+                decision_end = perf_counter_ns()
+                ingest_ns[step] = decision_start - ingest_start
+                decision_ns[step] = decision_end - decision_start
+                step += 1
+        else:
+            events += batch.arrivals.size
+            for arrivals in batch.arrivals:
+                ingest_start = perf_counter_ns()
+                controller.add_arrivals(arrivals)
+                decision_start = perf_counter_ns()
+                phase_index = controller.select_phase()
+                decision_end = perf_counter_ns()
+                ingest_ns[step] = decision_start - ingest_start
+                decision_ns[step] = decision_end - decision_start
+                lanes = controller.phase_lanes[phase_index]
+                counts[lanes] = np.maximum(counts[lanes] - discharge, 0)
+                step += 1
+    elapsed = time.perf_counter() - start
+    return LoadReport(steps, events, elapsed, generation_time, ingest_ns, decision_ns)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load-test the TrafficSignal controller with synthetic traffic.")
+    parser.add_argument("--lanes", type=int, default=4)
+    parser.add_argument("--steps", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--arrival-rate", type=float, default=0.3, help="Vehicles per lane per second at profile 1.0")
+    parser.add_argument("--batch-size", type=int, default=65536)
+    parser.add_argument("--full-cycle", action="store_true", help="Time run_cycle instead of select_phase")
+    args = parser.parse_args()
+
+    controller = TrafficSignal(HeadlessGUI(), JunctionConfig.with_approaches(args.lanes), sleep=lambda seconds: None)
+    workload = TrafficWorkload(args.lanes, seed=args.seed, arrival_rate=args.arrival_rate)
+    report = run_load_test(controller, workload, args.steps, args.batch_size, args.full_cycle)
+    print(report.summary())